@@ -20,7 +20,7 @@ def aggregate_ba_demand(demand, mapping):
     agg_demand = pd.DataFrame(index=demand.index)
     for key in mapping:
         mapping_bas = mapping[key]
-        valid_columns = list(set(mapping_bas) & set(demand.columns))
+        valid_columns = list(set(mapping_bas).intersection(demand.columns))
         if len(valid_columns) < len(mapping_bas):
             print()
             print("******************************")
@@ -49,7 +49,7 @@ def get_demand_in_loadzone(agg_demand, bus_map):
     """
     ba_agg = bus_map[["BA", "Pd"]].groupby("BA").sum().rename(columns={"Pd": "PdTotal"})
 
-    ba_scaling_factor = bus_map.merge(ba_agg, left_on="BA", right_on="BA")
+    ba_scaling_factor = bus_map.join(ba_agg, on="BA")
     ba_scaling_factor = ba_scaling_factor.assign(
         zone_scaling=lambda x: x["Pd"] / x["PdTotal"]
     )
@@ -54,22 +54,18 @@ def combine_efs_demand(efs_dem=None, non_efs_dem=None, save=None):
             )
 
     # Initialize agg_dem
-    agg_dem = pd.DataFrame(
-        0,
-        index=pd.date_range("2016-01-01", "2017-01-01", freq="H", closed="left"),
-        columns=sorted(set(abv2state) - {"AK", "HI"}),
-    )
+    dts = pd.date_range("2016-01-01", "2017-01-01", freq="H", closed="left")
+    states = set(abv2state) - {"AK", "HI"}
+    agg_dem = pd.DataFrame(0, index=dts, columns=sorted(states))
     agg_dem.index.name = "Local Time"
 
     # Aggregate the EFS sectoral demand
     if efs_dem is not None:
         for i in efs_dem:
             # Check the DataFrame dimensions and headers
-            if not efs_dem[i].index.equals(
-                pd.date_range("2016-01-01", "2017-01-01", freq="H", closed="left")
-            ):
+            if not efs_dem[i].index.equals(dts):
                 raise ValueError("This data does not have the proper timestamps.")
-            if set(efs_dem[i].columns) != set(abv2state) - {"AK", "HI"}:
+            if set(efs_dem[i].columns) != states:
                 raise ValueError("This data does not include all 48 states.")
 
             # Add the sectoral demand to the aggregate demand
@@ -79,11 +75,9 @@ def combine_efs_demand(efs_dem=None, non_efs_dem=None, save=None):
     if non_efs_dem is not None:
         for x in non_efs_dem:
             # Check the DataFrame dimensions and headers
-            if not x.index.equals(
-                pd.date_range("2016-01-01", "2017-01-01", freq="H", closed="left")
-            ):
+            if not x.index.equals(dts):
                 raise ValueError("This data does not have the proper timestamps.")
-            if set(x.columns) != set(abv2state) - {"AK", "HI"}:
+            if set(x.columns) != states:
                 raise ValueError("This data does not include all 48 states.")
 
             # Add the sectoral demand to the aggregate demand
@@ -126,6 +120,8 @@ def access_non_efs_demand(dem_paths):
         raise TypeError("Individual file paths must be input as a str.")
 
     # Obtain the sectoral demand data
+    dts = pd.date_range("2016-01-01", "2017-01-01", freq="H", closed="left")
+    states = set(abv2state) - {"AK", "HI"}
     sect_dem = []
     for i in dem_paths:
         # Try loading the locally-stored sectoral demand
@@ -135,11 +131,9 @@ def access_non_efs_demand(dem_paths):
             raise ValueError("This data does not provide the timestamps correctly.")
 
         # Check the DataFrame dimensions and headers
-        if not temp_dem.index.equals(
-            pd.date_range("2016-01-01", "2017-01-01", freq="H", closed="left")
-        ):
+        if not temp_dem.index.equals(dts):
             raise ValueError("This data does not have the proper timestamps.")
-        if set(temp_dem.columns) != set(abv2state) - {"AK", "HI"}:
+        if set(temp_dem.columns) != states:
             raise ValueError("This data does not include all 48 states.")
 
         # Store the setoral demand data
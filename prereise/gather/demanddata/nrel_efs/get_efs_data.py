@@ -1,8 +1,10 @@
+import importlib.util
 import io
 import os
 import platform
 import subprocess
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import requests
@@ -305,9 +307,11 @@ def _extract_data(z, zf_works, zip_name, csv_name, fpath, sz_path):
     return zf_works
 
 
-def partition_demand_by_sector(es, ta, year, sect=None, fpath="", save=False):
-    """Creates .csv files for each of the specified sectors given a specified
-    electrification scenario and technology advancement.
+def partition_demand_by_sector(
+    es, ta, year, sect=None, fpath="", save=False, file_format="csv"
+):
+    """Creates .csv or .parquet files for each of the specified sectors given a
+    specified electrification scenario and technology advancement.
 
     :param str es: An electrification scenario. Can choose one of: *'Reference'*,
         *'Medium'*, or *'High'*.
@@ -315,16 +319,22 @@ def partition_demand_by_sector(es, ta, year, sect=None, fpath="", save=False):
         or *'Rapid'*.
     :param int year: The selected year's worth of demand data. Can choose one of: 2018,
         2020, 2024, 2030, 2040, or 2050.
-    :param set/list sect: The sectors for which .csv files are to be created. Can
+    :param set/list sect: The sectors for which files are to be created. Can
         choose any of: *'Transportation'*, *'Residential'*, *'Commercial'*,
         *'Industrial'*, or *'All'*. Defaults to None.
     :param str fpath: The file path where the demand data might be saved and to where
         the sectoral data will be saved.
-    :param bool save: Determines whether or not the .csv file is saved. Defaults to
-        False. If the file is saved, it is saved to the same location as fpath.
+    :param bool save: Determines whether or not the sectoral files are saved. Defaults
+        to False. If the files are saved, they are saved to the same location as fpath.
+    :param str file_format: The format of the saved files. Can choose one of: *'csv'*
+        or *'parquet'*. Defaults to *'csv'*. Saving *'parquet'* files requires
+        pyarrow or fastparquet.
     :return: (*dict*) -- A dict of pandas.DataFrame objects that contain demand data
         for each state and time step in the specified sectors.
     :raises TypeError: if save is not input as a bool.
+    :raises ValueError: if file_format is not valid.
+    :raises ImportError: if file_format is *'parquet'* and no parquet engine is
+        installed.
     """
 
     # Account for the immutable default parameters
@@ -339,6 +349,7 @@ def partition_demand_by_sector(es, ta, year, sect=None, fpath="", save=False):
     fpath = _check_path(fpath)
     if not isinstance(save, bool):
         raise TypeError("save must be input as a bool.")
+    file_format = _check_file_format(file_format)
 
     # Specify the file name and path
     csv_name = f"EFSLoadProfile_{es}_{ta}.csv"
@@ -389,22 +400,23 @@ def partition_demand_by_sector(es, ta, year, sect=None, fpath="", save=False):
     }
     sect_dem = {i: sect_dem[i].rename_axis("Local Time", axis="index") for i in sect}
 
-    # Save the sectoral DataFrames to .csv files, if desired
+    # Save the sectoral DataFrames to files, if desired
     if save:
-        for i in sect:
-            new_csv_name = f"{i}_Demand_{es}_{ta}_{year}.csv"
-            new_csv_path = os.path.join(fpath, new_csv_name)
-            sect_dem[i].to_csv(new_csv_path)
+        _save_sectoral_data(
+            {f"{i}_Demand_{es}_{ta}_{year}": sect_dem[i] for i in sect},
+            fpath,
+            file_format,
+        )
 
     # Return the dictionary containing the formatted sectoral demand data
     return sect_dem
 
 
 def partition_flexibility_by_sector(
-    es, ta, flex, year, sect=None, fpath="", save=False
+    es, ta, flex, year, sect=None, fpath="", save=False, file_format="csv"
 ):
-    """Creates .csv files for each of the specified sectors given a specified
-    electrification scenario and technology advancement.
+    """Creates .csv or .parquet files for each of the specified sectors given a
+    specified electrification scenario and technology advancement.
 
     :param str es: An electrification scenario. Can choose one of: *'Reference'*,
         *'Medium'*, or *'High'*.
@@ -414,16 +426,22 @@ def partition_flexibility_by_sector(
         *'Enhanced'*.
     :param int year: The selected year's worth of demand data. Can choose one of: 2018,
         2020, 2024, 2030, 2040, or 2050.
-    :param set/list sect: The sectors for which .csv files are to be created. Can
+    :param set/list sect: The sectors for which files are to be created. Can
         choose any of: *'Transportation'*, *'Residential'*, *'Commercial'*,
         *'Industrial'*, or *'All'*. Defaults to None.
     :param str fpath: The file path where the demand data might be saved and to where
         the sectoral data will be saved.
-    :param bool save: Determines whether or not the .csv file is saved. Defaults to
-        False. If the file is saved, it is saved to the same location as fpath.
+    :param bool save: Determines whether or not the sectoral files are saved. Defaults
+        to False. If the files are saved, they are saved to the same location as fpath.
+    :param str file_format: The format of the saved files. Can choose one of: *'csv'*
+        or *'parquet'*. Defaults to *'csv'*. Saving *'parquet'* files requires
+        pyarrow or fastparquet.
     :return: (*dict*) -- A dict of pandas.DataFrame objects that contain flexibility
         data for each state and time step in the specified sectors.
     :raises TypeError: if save is not input as a bool.
+    :raises ValueError: if file_format is not valid.
+    :raises ImportError: if file_format is *'parquet'* and no parquet engine is
+        installed.
     """
 
     # Account for the immutable default parameters
@@ -439,6 +457,7 @@ def partition_flexibility_by_sector(
     fpath = _check_path(fpath)
     if not isinstance(save, bool):
         raise TypeError("save must be input as a bool.")
+    file_format = _check_file_format(file_format)
 
     # Specify the file name and path
     csv_name = f"EFSFlexLoadProfiles_{es}.csv"
@@ -495,12 +514,13 @@ def partition_flexibility_by_sector(
     }
     sect_flex = {i: sect_flex[i].rename_axis("Local Time", axis="index") for i in sect}
 
-    # Save the sectoral DataFrames to .csv files, if desired
+    # Save the sectoral DataFrames to files, if desired
     if save:
-        for i in sect:
-            new_csv_name = f"{i}_{flex}_Flexibility_{es}_{ta}_{year}.csv"
-            new_csv_path = os.path.join(fpath, new_csv_name)
-            sect_flex[i].to_csv(new_csv_path)
+        _save_sectoral_data(
+            {f"{i}_{flex}_Flexibility_{es}_{ta}_{year}": sect_flex[i] for i in sect},
+            fpath,
+            file_format,
+        )
 
     # Return the dictionary containing the formatted sectoral flexibility data
     return sect_flex
@@ -644,6 +664,68 @@ def _check_sectors(sect):
     return sect
 
 
+def _check_file_format(file_format):
+    """Checks the file format input to :py:func:`partition_demand_by_sector` and
+    :py:func:`partition_flexibility_by_sector`.
+
+    :param str file_format: The input file format. Can be any of: *'csv'* or
+        *'parquet'*.
+    :return: (*str*) -- The formatted file format.
+    :raises TypeError: if file_format is not input as a str.
+    :raises ValueError: if file_format is not valid.
+    :raises ImportError: if file_format is *'parquet'* and no parquet engine is
+        installed.
+    """
+
+    # Check that the input is of an appropriate type
+    if not isinstance(file_format, str):
+        raise TypeError("The file format must be input as a str.")
+
+    # Reformat file_format
+    file_format = file_format.lower()
+
+    # Check that file_format is valid
+    if file_format not in {"csv", "parquet"}:
+        raise ValueError(f"{file_format} is not a valid file format.")
+
+    # Check that a parquet engine is available before any data is processed
+    if file_format == "parquet" and not any(
+        importlib.util.find_spec(e) for e in ("pyarrow", "fastparquet")
+    ):
+        raise ImportError(
+            "Saving parquet files requires pyarrow or fastparquet to be installed."
+        )
+
+    # Return the reformatted file_format
+    return file_format
+
+
+def _save_sectoral_data(sect_data, fpath, file_format):
+    """Writes the sectoral DataFrames created by :py:func:`partition_demand_by_sector`
+    and :py:func:`partition_flexibility_by_sector` to disk. The files are written
+    concurrently since the writers spend most of their time on file I/O.
+
+    :param dict sect_data: Keys are the file names (without extension) and values are
+        the pandas.DataFrame objects to be saved.
+    :param str fpath: The file path to which the files will be saved.
+    :param str file_format: The format of the saved files. Can be one of: *'csv'* or
+        *'parquet'*.
+    """
+
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(
+                getattr(df, f"to_{file_format}"),
+                os.path.join(fpath, f"{name}.{file_format}"),
+            )
+            for name, df in sect_data.items()
+        ]
+
+    # Raise any exception that occurred while writing the files
+    for f in futures:
+        f.result()
+
+
 def account_for_leap_year(df):
     """Creates an additional day's worth of demand data to account for the additional
     day that occurs during leap years. This function takes an 8760-hour DataFrame as
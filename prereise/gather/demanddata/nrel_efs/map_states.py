@@ -95,9 +95,11 @@ def decompose_demand_profile_by_state_to_loadzone(
     pd_frac = {i: pd_by_lz[i] / pd_state_total[id2abv[i]] for i in id2abv}
 
     # Split states into load zones
-    df_lz = pd.DataFrame(index=df.index, columns=list(id2abv))
-    for i in df_lz.columns:
-        df_lz[i] = df[id2abv[i]] * pd_frac[i]
+    df_lz = (
+        df[[id2abv[i] for i in id2abv]]
+        .set_axis(list(id2abv), axis="columns")
+        .mul(pd.Series(pd_frac))
+    )
 
     # Convert from local hours to UTC time
     df_lz = shift_local_time_by_loadzone_to_utc(df_lz)
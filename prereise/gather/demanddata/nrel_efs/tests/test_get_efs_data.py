@@ -1,5 +1,6 @@
 import os
 import zipfile
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -8,10 +9,12 @@ from powersimdata.network.usa_tamu.constants.zones import abv2state
 
 from prereise.gather.demanddata.nrel_efs.get_efs_data import (
     _check_electrification_scenarios_for_download,
+    _check_file_format,
     _check_path,
     _check_technology_advancements_for_download,
     _download_data,
     _extract_data,
+    _save_sectoral_data,
     account_for_leap_year,
     partition_demand_by_sector,
     partition_flexibility_by_sector,
@@ -51,6 +54,60 @@ def test_check_path():
     assert test_fpath == exp_fpath
 
 
+def test_check_file_format():
+    # Run the check
+    test_file_format = _check_file_format(file_format="CSV")
+
+    # Compare the two file formats
+    assert test_file_format == "csv"
+
+    # Check that invalid file formats are rejected
+    with pytest.raises(TypeError):
+        _check_file_format(file_format=1)
+    with pytest.raises(ValueError):
+        _check_file_format(file_format="xlsx")
+
+
+def test_check_file_format_without_parquet_engine():
+    with patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(ImportError, match="pyarrow or fastparquet"):
+            _check_file_format(file_format="parquet")
+
+
+def test_save_sectoral_data(tmp_path):
+    # Create dummy sectoral data
+    sect_data = {
+        f"{i}_Demand": pd.DataFrame({"CA": [1.0, 2.0], "WA": [3.0, 4.0]})
+        for i in ["Commercial", "Residential"]
+    }
+
+    # Save the data to .csv files
+    _save_sectoral_data(sect_data, str(tmp_path), "csv")
+
+    # Compare the saved files with the original DataFrames
+    for name, df in sect_data.items():
+        saved_df = pd.read_csv(tmp_path / f"{name}.csv", index_col=0)
+        assert_frame_equal(df, saved_df)
+
+
+def test_save_sectoral_data_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    # Create dummy sectoral data
+    sect_data = {
+        f"{i}_Demand": pd.DataFrame({"CA": [1.0, 2.0], "WA": [3.0, 4.0]})
+        for i in ["Commercial", "Residential"]
+    }
+
+    # Save the data to .parquet files
+    _save_sectoral_data(sect_data, str(tmp_path), "parquet")
+
+    # Compare the saved files with the original DataFrames
+    for name, df in sect_data.items():
+        saved_df = pd.read_parquet(tmp_path / f"{name}.parquet")
+        assert_frame_equal(df, saved_df)
+
+
 @pytest.mark.integration
 def test_download_data():
     try:
@@ -97,3 +97,17 @@ def get_monthly_net_generation(state, eia_form_923, resource, hps=True):
     eia_net_generation = list(np.nan_to_num(eia_net_generation))
 
     return eia_net_generation
+
+
+def ll2uv_array(lon, lat):
+    """Convert arrays of (longitude, latitude) to unit vectors. Vectorized
+    equivalent of :func:`powersimdata.utility.distance.ll2uv`.
+
+    :param numpy.array/list lon: longitudes of the sites (in deg.).
+    :param numpy.array/list lat: latitudes of the sites (in deg.).
+    :return: (*numpy.array*) -- array of shape (N, 3) where each row is the
+        3-components (x,y,z) unit vector of a site.
+    """
+    lon, lat = np.radians(lon), np.radians(lat)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from powersimdata.input.grid import Grid
 from powersimdata.network.usa_tamu.constants.zones import abv2interconnect, abv2loadzone
@@ -36,16 +37,9 @@ def get_profile_by_state(profile, state, grid=None):
     ]
 
     hydro_capacity_in_state = hydro_plant_in_state["Pmax"].sum()
-    hydro_profile = pd.DataFrame(
-        columns=hydro_plant_in_state.index, index=profile.index
-    )
-
-    for i in hydro_profile.columns:
-        factor = hydro_plant_in_state.loc[i]["Pmax"] / hydro_capacity_in_state
-        plant_profile = [v * factor for v in profile]
-        hydro_profile[i] = plant_profile.copy()
+    factor = hydro_plant_in_state["Pmax"] / hydro_capacity_in_state
 
-    return hydro_profile
+    return _scale_profile_by_plant(profile, factor)
 
 
 def get_profile_by_plant(plant_df, total_profile):
@@ -72,16 +66,27 @@ def get_profile_by_plant(plant_df, total_profile):
         raise ValueError("Pmax must be one of the columns of plant_df")
 
     total_hydro_capacity = plant_df["Pmax"].sum()
-    res_profile = pd.DataFrame(index=total_profile.index, columns=plant_df.index)
-
-    for plantid in res_profile.columns:
-        if total_hydro_capacity == 0:
-            factor = 0
-        else:
-            factor = plant_df.loc[plantid]["Pmax"] / total_hydro_capacity
-        plant_profile = [val * factor for val in total_profile]
-        res_profile[plantid] = plant_profile.copy()
-    return res_profile
+    if total_hydro_capacity == 0:
+        factor = pd.Series(0, index=plant_df.index)
+    else:
+        factor = plant_df["Pmax"] / total_hydro_capacity
+
+    return _scale_profile_by_plant(total_profile, factor)
+
+
+def _scale_profile_by_plant(profile, factor):
+    """Build plant level profiles by scaling an aggregated profile.
+
+    :param pandas.Series/list profile: aggregated profile.
+    :param pandas.Series factor: share of the aggregated profile for each plant.
+    :return: (*pandas.DataFrame*) -- profile for each plant in index of ``factor``.
+    """
+    profile = pd.Series(profile)
+    return pd.DataFrame(
+        np.outer(profile.to_numpy(dtype=float), factor.to_numpy(dtype=float)),
+        index=profile.index,
+        columns=factor.index,
+    )
 
 
 def get_normalized_profile(plant_df, plant_profile):
@@ -63,7 +63,7 @@ def retrieve_data(
 
     dt_range = dt.loc[(dt.datetime >= start_date) & (dt.datetime < end_date)]
 
-    data = pd.DataFrame({"Pout": [], "plant_id": [], "ts": [], "ts_id": []})
+    data = []
 
     for (key, val) in tqdm(ij.items(), total=len(ij)):
         ghi = f["GHI"][min(dt_range.index) : max(dt_range.index) + 1, val[0], val[1]]
@@ -72,14 +72,17 @@ def retrieve_data(
         data_loc["ts_id"] = range(1, len(ghi) + 1)
         data_loc["ts"] = pd.date_range(start=start_date, end=end_date, freq="H")[:-1]
 
-        for i in coord[key]:
-            data_site = data_loc.copy()
-            data_site["plant_id"] = i
+        data += [data_loc.assign(plant_id=i) for i in coord[key]]
 
-            data = data.append(data_site, ignore_index=True, sort=False)
+    columns = ["Pout", "plant_id", "ts", "ts_id"]
+    if data:
+        data = pd.concat(data, ignore_index=True, sort=False)[columns]
+    else:
+        data = pd.DataFrame({c: [] for c in columns})
 
     data["plant_id"] = data["plant_id"].astype(np.int32)
     data["ts_id"] = data["ts_id"].astype(np.int32)
+    data["Pout"] = data["Pout"].astype(np.float32)
 
     data.sort_values(by=["ts_id", "plant_id"], inplace=True)
     data.reset_index(inplace=True, drop=True)
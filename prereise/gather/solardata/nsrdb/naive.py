@@ -23,7 +23,7 @@ def retrieve_data(solar_plant, email, api_key, year="2016"):
 
     api = NrelApi(email, api_key)
 
-    data = pd.DataFrame({"Pout": [], "plant_id": [], "ts": [], "ts_id": []})
+    data = []
 
     for key in tqdm(coord.keys(), total=len(coord)):
         lat, lon = key[1], key[0]
@@ -38,14 +38,17 @@ def retrieve_data(solar_plant, email, api_key, year="2016"):
             :-1
         ]
 
-        for i in coord[key]:
-            data_site = data_loc.copy()
-            data_site["plant_id"] = i
+        data += [data_loc.assign(plant_id=i) for i in coord[key]]
 
-            data = data.append(data_site, ignore_index=True, sort=False)
+    columns = ["Pout", "plant_id", "ts", "ts_id"]
+    if data:
+        data = pd.concat(data, ignore_index=True, sort=False)[columns]
+    else:
+        data = pd.DataFrame({c: [] for c in columns})
 
     data["plant_id"] = data["plant_id"].astype(np.int32)
     data["ts_id"] = data["ts_id"].astype(np.int32)
+    data["Pout"] = data["Pout"].astype(np.float32)
 
     data.sort_values(by=["ts_id", "plant_id"], inplace=True)
     data.reset_index(inplace=True, drop=True)
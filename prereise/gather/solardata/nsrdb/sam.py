@@ -1,3 +1,5 @@
+from calendar import isleap
+
 import numpy as np
 import pandas as pd
 import PySAM.Pvwattsv7 as PVWatts
@@ -31,13 +33,11 @@ def generate_timestamps_without_leap_day(year):
         pandas.Timestamp/None: timestamp for the first hour of the leap day (if any).
     """
     # SAM only takes 365 days, so for a leap year: leave out the leap day.
-    try:
+    sam_dates = pd.date_range(start=f"{year}-01-01-00", freq="H", periods=365 * 24)
+    if isleap(int(year)):
         leap_day = (pd.Timestamp(f"{year}-02-29-00").dayofyear - 1) * 24
-        sam_dates = pd.date_range(start=f"{year}-01-01-00", freq="H", periods=365 * 24)
-        sam_dates = sam_dates.map(lambda t: t.replace(year=int(year)))
-    except ValueError:
+    else:
         leap_day = None
-        sam_dates = pd.date_range(start=f"{year}-01-01-00", freq="H", periods=365 * 24)
     return sam_dates, leap_day
 
 
@@ -89,7 +89,7 @@ def retrieve_data_blended(
     if grid is None:
         if solar_plant is None or interconnect_to_state_abvs is None:
             raise TypeError(xor_err_msg)
-        if not {"state_abv", "interconnect"} <= set(solar_plant.columns):
+        if not {"state_abv", "interconnect"}.issubset(solar_plant.columns):
             raise ValueError("solar_plant needs 'state_abv' and 'interconnect' columns")
         # Create mappings from other inputs
         zone_id_to_state_abv = {
@@ -171,7 +171,9 @@ def retrieve_data_blended(
                 power = data[first_plant_id]
             data[plant_id] = power
 
-    return pd.DataFrame(data, index=real_dates).sort_index(axis="columns")
+    return pd.DataFrame(data, index=real_dates, dtype=np.float32).sort_index(
+        axis="columns"
+    )
 
 
 def retrieve_data_individual(
@@ -199,13 +201,26 @@ def retrieve_data_individual(
         "Single-Axis Tracking?": 2,
         "Dual-Axis Tracking?": 4,
     }
-    if not all(solar_plant[array_type_mapping.keys()].sum(axis=1) == 1):
+    tracking = solar_plant[list(array_type_mapping)]
+    if not all(tracking.to_numpy().sum(axis=1) == 1):
         raise ValueError("Indeterminate tracking information for one or more plants")
     # Select the appropriate 'array type' to pass to SAM
-    plant_array_types = (
-        solar_plant[array_type_mapping.keys()]
-        .astype(bool)
-        .apply(lambda x: array_type_mapping[x.idxmax()], axis=1)
+    plant_array_types = tracking.astype(bool).idxmax(axis=1).map(array_type_mapping)
+
+    # Parse numeric attributes once for all plants, unparseable entries become NaN
+    float_columns = ["Tilt Angle", "Nameplate Capacity (MW)", "DC Net Capacity (MW)"]
+    plant_floats = solar_plant[float_columns].apply(pd.to_numeric, errors="coerce")
+    # Verify that each solar plant has the numeric attributes passed to SAM
+    invalid = plant_floats[float_columns[1:]].isna().any(axis=1) | (
+        plant_floats["Tilt Angle"].isna() & (plant_array_types == 0)
+    )
+    if invalid.any():
+        raise ValueError(
+            "Invalid tilt angle or capacity information for plants: "
+            f"{list(invalid.index[invalid])}"
+        )
+    plant_ilr = (
+        plant_floats["DC Net Capacity (MW)"] / plant_floats["Nameplate Capacity (MW)"]
     )
 
     real_dates = pd.date_range(
@@ -231,15 +246,14 @@ def retrieve_data_individual(
         ).to_dict()
 
         for plant_id in plants:
-            series = solar_plant.loc[plant_id]
-            ilr = series["DC Net Capacity (MW)"] / series["Nameplate Capacity (MW)"]
+            ilr = plant_ilr.loc[plant_id]
             plant_pv_dict = {
                 "system_capacity": ilr,
                 "dc_ac_ratio": ilr,
                 "array_type": plant_array_types.loc[plant_id],
             }
             if plant_pv_dict["array_type"] == 0:
-                plant_pv_dict["tilt"] = series["Tilt Angle"]
+                plant_pv_dict["tilt"] = plant_floats.loc[plant_id, "Tilt Angle"]
             pv_dict = {**default_pv_parameters, **plant_pv_dict}
             power = calculate_power(solar_data, pv_dict)
             if leap_day is not None:
@@ -247,4 +261,6 @@ def retrieve_data_individual(
 
             data[plant_id] = power
 
-    return pd.DataFrame(data, index=real_dates).sort_index(axis="columns")
+    return pd.DataFrame(data, index=real_dates, dtype=np.float32).sort_index(
+        axis="columns"
+    )
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from prereise.gather.solardata.nsrdb.sam import retrieve_data_individual
+
+
+def _solar_plant(**kwargs):
+    plant = pd.DataFrame(
+        {
+            "lat": [35.0, 36.0],
+            "lon": [-110.0, -111.0],
+            "Fixed Tilt?": [True, False],
+            "Single-Axis Tracking?": [False, True],
+            "Dual-Axis Tracking?": [False, False],
+            "Tilt Angle": [25, "-"],
+            "Nameplate Capacity (MW)": [10, 20],
+            "DC Net Capacity (MW)": [13, 26],
+        },
+        index=pd.Index([101, 102], name="plant_id"),
+    )
+    for column, values in kwargs.items():
+        plant[column] = values
+    return plant
+
+
+def test_retrieve_data_individual_tracking():
+    plant = _solar_plant(**{"Dual-Axis Tracking?": [True, False]})
+    with pytest.raises(ValueError, match="Indeterminate tracking information"):
+        retrieve_data_individual("foo@bar.com", "key", plant)
+
+
+def test_retrieve_data_individual_invalid_floats():
+    arg = (
+        {"Tilt Angle": ["-", 30]},
+        {"Nameplate Capacity (MW)": [10, "-"]},
+        {"DC Net Capacity (MW)": [None, 26]},
+    )
+    for a in arg:
+        plant = _solar_plant(**a)
+        invalid = 102 if "Nameplate Capacity (MW)" in a else 101
+        with pytest.raises(ValueError, match=rf"plants: \[{invalid}\]"):
+            retrieve_data_individual("foo@bar.com", "key", plant)
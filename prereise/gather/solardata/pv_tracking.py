@@ -26,8 +26,9 @@ def get_pv_tracking_data():
             "Fixed Tilt?",
         ],
     ).fillna("N")
-    pv_info = solar_plant_info[solar_plant_info["Prime Mover"] == "PV"].copy()
-    pv_info.drop("Prime Mover", axis=1, inplace=True)
+    pv_info = solar_plant_info[solar_plant_info["Prime Mover"] == "PV"].drop(
+        columns="Prime Mover"
+    )
 
     return pv_info
 
@@ -50,26 +51,17 @@ def get_pv_tracking_ratio_state(pv_info, state):
         if s not in abv2state.keys():
             raise ValueError("Invalid State: %s" % s)
 
-    pv_info_state = pv_info[pv_info["State"].isin(state)].copy()
+    pv_info_state = pv_info[pv_info["State"].isin(state)]
 
     if pv_info_state.empty:
         print("No solar PV plant in %s" % ", ".join(state))
         return
 
-    fix = 0
-    single = 0
-    dual = 0
-    total_capacity = 0
-    for i in pv_info_state.index:
-        capacity = pv_info_state.loc[i]["Nameplate Capacity (MW)"]
-        if pv_info_state.loc[i]["Single-Axis Tracking?"] == "Y":
-            single += capacity
-            total_capacity += capacity
-        if pv_info_state.loc[i]["Dual-Axis Tracking?"] == "Y":
-            dual += capacity
-            total_capacity += capacity
-        if pv_info_state.loc[i]["Fixed Tilt?"] == "Y":
-            fix += capacity
-            total_capacity += capacity
+    capacity = pv_info_state["Nameplate Capacity (MW)"]
+    fix, single, dual = (
+        capacity[pv_info_state[c] == "Y"].sum()
+        for c in ["Fixed Tilt?", "Single-Axis Tracking?", "Dual-Axis Tracking?"]
+    )
+    total_capacity = fix + single + dual
 
     return fix / total_capacity, single / total_capacity, dual / total_capacity
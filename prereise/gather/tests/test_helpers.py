@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
+from powersimdata.utility.distance import ll2uv
 
-from prereise.gather.helpers import get_monthly_net_generation
+from prereise.gather.helpers import get_monthly_net_generation, ll2uv_array
 from prereise.gather.tests.mock_generation import create_mock_generation_data_frame
 
 
@@ -44,3 +46,10 @@ def test_get_monthly_net_generation():
 
     for i in range(8):
         assert res[i] == [i + 1] * 12
+
+
+def test_ll2uv_array():
+    lon = [-122.4, 0, 45.5, 180]
+    lat = [37.8, 0, -12.25, 90]
+    expected = np.array([ll2uv(i, j) for i, j in zip(lon, lat)])
+    np.testing.assert_allclose(ll2uv_array(lon, lat), expected)
@@ -4,10 +4,10 @@ import os
 import numpy as np
 import pandas as pd
 import pygrib
-from powersimdata.utility.distance import ll2uv
 from scipy.spatial import KDTree
 from tqdm import tqdm
 
+from prereise.gather.helpers import ll2uv_array
 from prereise.gather.winddata import const
 from prereise.gather.winddata.hrrr.helpers import formatted_filename
 from prereise.gather.winddata.impute import linear
@@ -52,16 +52,11 @@ def find_closest_wind_grids(wind_farms, wind_data_lat_long):
         wind_data_lat_long[1].flatten(),
     )
     assert len(grid_lats) == len(grid_lons)
-    grid_lat_lon_unit_vectors = [ll2uv(i, j) for i, j in zip(grid_lons, grid_lats)]
+    grid_lat_lon_unit_vectors = ll2uv_array(grid_lons, grid_lats)
 
     tree = KDTree(grid_lat_lon_unit_vectors)
 
-    wind_farm_lats = wind_farms.lat.values
-    wind_farm_lons = wind_farms.lon.values
-
-    wind_farm_unit_vectors = [
-        ll2uv(i, j) for i, j in zip(wind_farm_lons, wind_farm_lats)
-    ]
+    wind_farm_unit_vectors = ll2uv_array(wind_farms.lon.values, wind_farms.lat.values)
     _, indices = tree.query(wind_farm_unit_vectors)
 
     return indices
@@ -87,8 +82,8 @@ def extract_wind_speed(wind_farms, start_dt, end_dt, directory):
     )
     dts = pd.date_range(start=start_dt, end=end_dt, freq="H").to_pydatetime()
     # Fetch wind speed data for each wind farm (or store NaN as applicable)
-    wind_speed_data = pd.DataFrame(index=dts, columns=wind_farms.index, dtype=float)
-    for dt in tqdm(dts):
+    wind_speed = np.empty((len(dts), len(wind_farms)))
+    for i, dt in enumerate(tqdm(dts)):
         gribs = pygrib.open(os.path.join(directory, formatted_filename(dt)))
         try:
             u_component = gribs.select(name=U_COMPONENT_SELECTOR)[0].values.flatten()
@@ -99,16 +94,16 @@ def extract_wind_speed(wind_farms, start_dt, end_dt, directory):
             wind_farm_specific_v_component = v_component[
                 wind_farm_to_closest_wind_grid_indices
             ]
-            wind_speed_data.loc[dt] = np.sqrt(
-                pow(wind_farm_specific_u_component, 2)
-                + pow(wind_farm_specific_v_component, 2)
+            wind_speed[i] = np.hypot(
+                wind_farm_specific_u_component, wind_farm_specific_v_component
             )
         except ValueError:
             # If the GRIB file is empty, no wind speed values can be selected
-            wind_speed_data.loc[dt] = np.nan
+            wind_speed[i] = np.nan
 
     # For each column, linearly interpolate any NaN values
-    linear(wind_speed_data)
+    linear(wind_speed)
+    wind_speed_data = pd.DataFrame(wind_speed, index=dts, columns=wind_farms.index)
 
     return wind_speed_data
 
@@ -147,19 +142,17 @@ def calculate_pout_blended(wind_farms, start_dt, end_dt, directory):
     wind_speed_data = extract_wind_speed(wind_farms, start_dt, end_dt, directory)
     dts = wind_speed_data.index
 
-    # Then calculate wind power based on wind speed
-    wind_power_data = [
-        [
-            get_power(
-                turbine_power_curves,
-                state_power_curves,
-                wind_speed_data.loc[dt, w],
-                turbine_types.loc[w],
-            )
-            for w in wind_farms.index
-        ]
-        for dt in tqdm(dts)
-    ]
+    # Then calculate wind power based on wind speed, looking up each farm's power
+    # curve once for the whole time series
+    wind_power_data = {
+        w: get_power(
+            turbine_power_curves,
+            state_power_curves,
+            wind_speed_data[w].to_numpy(),
+            turbine_types.loc[w],
+        )
+        for w in tqdm(wind_farms.index)
+    }
     df = pd.DataFrame(data=wind_power_data, index=dts, columns=wind_farms.index)
 
     return df
@@ -218,7 +211,7 @@ def calculate_pout_individual(wind_farms, start_dt, end_dt, directory):
         return np.interp(wspd, curve.index.values, curve.values, left=0, right=0)
 
     req_cols = {const.mfg_col, const.model_col, const.hub_height_col}
-    if not req_cols <= set(wind_farms.columns):
+    if not req_cols.issubset(wind_farms.columns):
         raise ValueError(f"wind_farms requires columns: {req_cols}")
 
     # Create cached, curried function for use with apply
@@ -238,13 +231,10 @@ def calculate_pout_individual(wind_farms, start_dt, end_dt, directory):
     wind_speed_data = extract_wind_speed(wind_farms, start_dt, end_dt, directory)
     dts = wind_speed_data.index
 
-    wind_power_data = [
-        [
-            interpolate(wind_speed_data.loc[dt, w], shifted_power_curves.loc[w])
-            for w in wind_farms.index
-        ]
-        for dt in tqdm(dts)
-    ]
+    wind_power_data = {
+        w: interpolate(wind_speed_data[w].to_numpy(), shifted_power_curves.loc[w])
+        for w in tqdm(wind_farms.index)
+    }
 
     df = pd.DataFrame(data=wind_power_data, index=dts, columns=wind_farms.index)
 
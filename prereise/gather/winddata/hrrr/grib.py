@@ -22,6 +22,16 @@ class GribRecordInfo:
         this data is forecasted for
     """
 
+    __slots__ = (
+        "message_number",
+        "beginning_byte",
+        "ending_byte",
+        "initialization_date",
+        "variable",
+        "level",
+        "forecast",
+    )
+
     message_number: str
     beginning_byte: str
     ending_byte: str
@@ -1,3 +1,5 @@
+from math import hypot
+
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
@@ -78,9 +80,11 @@ def simple(data, wind_farm, inplace=True, curve="state"):
 
         min_u, max_u = select_plant["U"].min(), select_plant["U"].max()
         min_v, max_v = select_plant["V"].min(), select_plant["V"].max()
-        data_impute.at[j, "U"] = min_u + (max_u - min_u) * np.random.random()
-        data_impute.at[j, "V"] = min_v + (max_v - min_v) * np.random.random()
-        wspd = np.sqrt(data.loc[j].U ** 2 + data.loc[j].V ** 2)
+        u = min_u + (max_u - min_u) * np.random.random()
+        v = min_v + (max_v - min_v) * np.random.random()
+        data_impute.at[j, "U"] = u
+        data_impute.at[j, "V"] = v
+        wspd = hypot(u, v)
         normalized_power = get_power(tpc, spc, wspd, "IEC class 2")
         data_impute.at[j, "Pout"] = normalized_power
 
@@ -128,10 +132,11 @@ def gaussian(data, wind_farm, inplace=True, curve="state"):
         cov = np.cov(uv_data)
         mean = np.mean(uv_data, axis=1)
         sample = np.random.multivariate_normal(mean=mean, cov=cov, size=1)
-        data_impute.at[hour, "U"] = sample[0][0]
-        data_impute.at[hour, "V"] = sample[0][1]
+        u, v = sample[0]
+        data_impute.at[hour, "U"] = u
+        data_impute.at[hour, "V"] = v
 
-        wspd = np.sqrt(data.loc[hour].U ** 2 + data.loc[hour].V ** 2)
+        wspd = hypot(u, v)
         normalized_power = get_power(tpc, spc, wspd, "IEC class 2")
         data_impute.at[hour, "Pout"] = normalized_power
 
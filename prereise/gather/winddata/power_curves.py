@@ -40,13 +40,14 @@ def build_state_curves(form_860, power_curves, maxspd=30, default="IEC class 2",
     """
     print("building state_power_curves")
 
-    states = form_860["State"].unique()
     curve_x = np.arange(0, maxspd + const.new_curve_res, const.new_curve_res)
     state_curves = pd.DataFrame(curve_x, columns=["Speed bin (m/s)"])
-    for s in states:
+    state_groups = form_860.groupby(
+        form_860["State"].astype("category"), observed=True, sort=False
+    )
+    for s, state_wind_farms in state_groups:
         cumulative_curve = np.zeros_like(curve_x)
         cumulative_capacity = 0
-        state_wind_farms = form_860[form_860["State"] == s]
         for i, f in enumerate(state_wind_farms.index):
             # Look up attributes from Form 860
             farm_capacity = state_wind_farms[const.capacity_col].iloc[i]
@@ -79,27 +80,26 @@ def build_state_curves(form_860, power_curves, maxspd=30, default="IEC class 2",
     offshore_rsd = 0.25
 
     if rsd > 0:
-        smoothed_state_curves = pd.DataFrame(
-            index=state_curves.index, columns=state_curves.columns
-        )
-        for s in state_curves.columns:
-            xs = state_curves.index
-            ys = np.zeros_like(xs)
-            for i, x in enumerate(xs):
-                if x == 0:
-                    continue
-                if s == "Offshore":
-                    sd = max(1.5, offshore_rsd * x)
-                else:
-                    sd = max(1.5, rsd * x)
+        xs = state_curves.index.to_numpy()
+        curves = state_curves.to_numpy()
+        offshore = state_curves.columns == "Offshore"
+        ys = np.zeros_like(curves)
+        # The smoothing kernel only depends on the wind speed and the relative
+        # standard deviation: build it once per speed and apply it to all states
+        for i, x in enumerate(xs):
+            if x == 0:
+                continue
+            for columns, column_rsd in ((~offshore, rsd), (offshore, offshore_rsd)):
+                sd = max(1.5, column_rsd * x)
                 min_point = x - 3 * sd
                 max_point = x + 3 * sd
                 sample_points = np.logical_and(xs > min_point, xs < max_point)
                 cdf_points = norm.cdf(xs[sample_points], loc=x, scale=sd)
                 pdf_points = np.concatenate((np.zeros(1), np.diff(cdf_points)))
-                ys[i] = np.dot(pdf_points, state_curves[s][sample_points])
-            smoothed_state_curves[s] = ys
-        state_curves = smoothed_state_curves
+                ys[i, columns] = np.dot(pdf_points, curves[sample_points][:, columns])
+        state_curves = pd.DataFrame(
+            ys, index=state_curves.index, columns=state_curves.columns
+        )
 
     return state_curves
 
@@ -139,10 +139,10 @@ def get_power(power_curves, state_power_curves, wspd, turbine, default="IEC clas
 
     :param pandas.DataFrame power_curves: turbine power curves data.
     :param pandas.DataFrame state_power_curves: state average power curves data.
-    :param float wspd: wind speed (in m/s).
+    :param float/numpy.array wspd: wind speed (in m/s).
     :param str turbine: turbine name, IEC class, or state code for average.
     :param str default: default turbine name.
-    :return: (*float*) -- normalized power.
+    :return: (*float/numpy.array*) -- normalized power.
     """
     if turbine in state_power_curves.columns:
         curve = state_power_curves[turbine]
@@ -11,17 +11,10 @@ def to_reise(data):
     ts = data["ts"].unique()
     plant_id = data[data.ts_id == 1].plant_id.values
 
-    profile = None
-    for i in range(1, max(data.ts_id) + 1):
-        data_tmp = pd.DataFrame(
-            {"Pout": data[data.ts_id == i].Pout.values}, index=plant_id
-        )
-        if i == 1:
-            profile = data_tmp.T
-        else:
-            profile = profile.append(data_tmp.T, sort=False, ignore_index=True)
-
-    profile.set_index(ts, inplace=True)
+    pout = data.sort_values("ts_id", kind="mergesort").Pout.values
+    profile = pd.DataFrame(
+        pout.reshape(len(ts), len(plant_id)), index=ts, columns=plant_id
+    )
     profile.index.name = "UTC"
 
     return profile
@@ -1,13 +1,13 @@
 import datetime
-from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
 from netCDF4 import Dataset
 from powersimdata.network.usa_tamu.constants.zones import id2abv
-from powersimdata.utility.distance import angular_distance, ll2uv
+from scipy.spatial import KDTree
 from tqdm import tqdm
 
+from prereise.gather.helpers import ll2uv_array
 from prereise.gather.winddata.power_curves import (
     get_power,
     get_state_power_curves,
@@ -47,10 +47,8 @@ def retrieve_data(wind_farm, start_date="2016-01-01", end_date="2016-12-31"):
     lat_target = wind_farm.lat.values
     id_target = wind_farm.index.values
     state_target = [
-        "Offshore"
-        if wind_farm.loc[i].type == "wind_offshore"
-        else id2abv[wind_farm.loc[i].zone_id]
-        for i in id_target
+        "Offshore" if t == "wind_offshore" else id2abv[z]
+        for t, z in zip(wind_farm.type, wind_farm.zone_id)
     ]
 
     start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
@@ -61,7 +59,7 @@ def retrieve_data(wind_farm, start_date="2016-01-01", end_date="2016-12-31"):
     url_count = len(noaa.get_path_list(start, end))
 
     missing = []
-    target2grid = OrderedDict()
+    target2grid = np.zeros(n_target, dtype=int)
     size = url_count * n_target
     data = pd.DataFrame(
         {
@@ -78,14 +76,9 @@ def retrieve_data(wind_farm, start_date="2016-01-01", end_date="2016-12-31"):
     step = datetime.timedelta(hours=1)
 
     def calc_angular_dist(lon_grid, lat_grid):
-        n_grid = len(lon_grid)
-        for j in range(n_target):
-            uv_target = ll2uv(lon_target[j], lat_target[j])
-            angle = [
-                angular_distance(uv_target, ll2uv(lon_grid[k], lat_grid[k]))
-                for k in range(n_grid)
-            ]
-            target2grid[id_target[j]] = np.argmin(angle)
+        tree = KDTree(ll2uv_array(lon_grid, lat_grid))
+        # The smallest chord between unit vectors is also the smallest angle
+        target2grid[:] = tree.query(ll2uv_array(lon_target, lat_target))[1]
 
     def handle_missing(response, data_tmp):
         missing.append(response.url)
@@ -114,17 +107,13 @@ def retrieve_data(wind_farm, start_date="2016-01-01", end_date="2016-12-31"):
 
                 if first:
                     # The angular distance is calculated once. The target to grid
-                    # correspondence is stored in a dictionary.
+                    # correspondence is stored in an array of grid indices.
                     calc_angular_dist(lon_grid, lat_grid)
                     first = False
 
-                data_tmp["U"] = [
-                    u_wsp[target2grid[id_target[j]]] for j in range(n_target)
-                ]
-                data_tmp["V"] = [
-                    v_wsp[target2grid[id_target[j]]] for j in range(n_target)
-                ]
-                wspd_target = np.sqrt(pow(data_tmp["U"], 2) + pow(data_tmp["V"], 2))
+                data_tmp["U"] = u_wsp[target2grid]
+                data_tmp["V"] = v_wsp[target2grid]
+                wspd_target = np.hypot(data_tmp["U"], data_tmp["V"])
                 power = [
                     get_power(tpc, spc, wspd_target[j], state_target[j])
                     for j in range(n_target)
@@ -183,6 +183,11 @@ class TestGetPower(unittest.TestCase):
         self.assertIsInstance(power, float)
         self.assertAlmostEqual(power, 0.971666667)
 
+    def test_get_power_default_array(self):
+        power = get_power(self.tpc, self.spc, np.array([0, 5, 10, 20, 30]), "foo")
+        self.assertIsInstance(power, np.ndarray)
+        np.testing.assert_array_equal(power, [0, 0.1031, 0.8554, 1, 0])
+
 
 class TestGetForm860(unittest.TestCase):
     def test_bad_dir(self):